@@ -5,7 +5,7 @@
 //
 // Architecture:
 // - Single shared browser instance (Chromium)
-// - Multiple browser contexts (isolated sessions)
+// - Multiple browser contexts (isolated sessions), idle ones pooled for reuse
 // - RESTful HTTP endpoints for automation tasks
 // - Artifact storage (screenshots, videos, traces)
 //
@@ -13,11 +13,16 @@
 // - GET  /health              - Health check and status
 // - POST /browser/new         - Create new browser context
 // - POST /browser/:id/close   - Close browser context
+// - POST /browser/acquire     - Get a pooled (or new) browser context
+// - POST /browser/:id/release - Return browser context to the idle pool
 // - POST /navigate            - Navigate to URL
+// - POST /viewport            - Resize the page viewport
 // - POST /screenshot          - Take screenshot
+// - POST /screenshot/batch    - Screenshot one URL at several viewports
 // - POST /evaluate            - Execute JavaScript
 // - POST /pdf                 - Generate PDF
 // - POST /accessibility       - Run accessibility audit
+// - POST /batch               - Run several operations in one request
 //
 // Usage:
 // Called by workspace container via: http://playwright:3000
@@ -45,10 +50,16 @@ app.use(express.json({ limit: '10mb' })); // Parse JSON bodies (large for page c
 // ============================================================================
 // browser: Shared Chromium instance
 // contexts: Map of contextId -> { context, page, metadata }
+// idleContexts: released contexts available for reuse, keyed by options
 // ============================================================================
 let browser = null;
 const contexts = new Map();
 
+// Idle context pool: options signature -> [contextId, ...]
+// Released contexts are reset and kept here for reuse by /browser/acquire
+const idleContexts = new Map();
+const DEFAULT_POOL_SIZE = 4;
+
 // ============================================================================
 // BROWSER INITIALIZATION
 // ============================================================================
@@ -99,6 +110,18 @@ async function ensureArtifactDir(subdir) {
     return dir;
 }
 
+// Client asked for the raw artifact instead of the JSON envelope
+function wantsFile(req) {
+    return req.get('Accept') === 'application/octet-stream';
+}
+
+// Stream an artifact file as the response body
+function sendArtifact(res, filepath) {
+    res.set('X-Artifact-Path', filepath);
+    res.type('application/octet-stream');
+    res.sendFile(filepath);
+}
+
 // ============================================================================
 // HEALTH CHECK ENDPOINT
 // ============================================================================
@@ -113,7 +136,9 @@ app.get('/health', (req, res) => {
         browser: {
             running: browser !== null,
             version: browser ? browser.version() : 'not initialized',
-            contexts: contexts.size
+            contexts: contexts.size,
+            idleContexts: Array.from(idleContexts.values())
+                .reduce((total, ids) => total + ids.length, 0)
         },
         memory: {
             used: Math.round(process.memoryUsage().heapUsed / 1024 / 1024),
@@ -129,6 +154,218 @@ app.get('/health', (req, res) => {
     res.json(health);
 });
 
+// ============================================================================
+// BROWSER OPERATIONS
+// ============================================================================
+// Shared implementations behind the HTTP endpoints and POST /batch.
+// Each takes the request body fields and returns the JSON response object.
+// ============================================================================
+
+// Create new browser context (isolated session) with a single page
+async function createContext({ options = {} } = {}) {
+    // Create new context with options
+    const context = await browser.newContext({
+        viewport: options.viewport || { width: 1920, height: 1080 },
+        userAgent: options.userAgent,
+        locale: options.locale || 'en-US',
+        timezoneId: options.timezoneId,
+        ...options
+    });
+
+    // Create new page in context
+    const page = await context.newPage();
+
+    // Generate context ID and store
+    const contextId = generateContextId();
+    contexts.set(contextId, {
+        context,
+        page,
+        createdAt: new Date().toISOString(),
+        metadata: options.metadata || {},
+        poolKey: JSON.stringify(options),
+        viewport: options.viewport || { width: 1920, height: 1080 }
+    });
+
+    console.log(`✅ Created browser context: ${contextId}`);
+
+    return {
+        contextId,
+        status: 'created',
+        viewport: options.viewport || { width: 1920, height: 1080 }
+    };
+}
+
+// Close browser context and remove it from the registry
+async function closeContext({ contextId }) {
+    const contextData = validateContext(contextId);
+
+    // Close context
+    await contextData.context.close();
+
+    // Remove from map (and from the idle pool if it was parked there)
+    contexts.delete(contextId);
+    const idle = idleContexts.get(contextData.poolKey);
+    if (idle && idle.includes(contextId)) {
+        idle.splice(idle.indexOf(contextId), 1);
+    }
+
+    console.log(`✅ Closed browser context: ${contextId}`);
+
+    return { status: 'closed', contextId };
+}
+
+// Reuse an idle context created with the same options, or create one
+async function acquireContext({ options = {} } = {}) {
+    const idle = idleContexts.get(JSON.stringify(options));
+    if (idle && idle.length > 0) {
+        const contextId = idle.pop();
+        const { viewport } = contexts.get(contextId);
+
+        console.log(`✅ Reused browser context: ${contextId}`);
+
+        return { contextId, status: 'reused', viewport };
+    }
+
+    return createContext({ options });
+}
+
+// Reset a context and park it in the idle pool (or close it if the pool is full)
+async function releaseContext({ contextId, poolSize }) {
+    const contextData = validateContext(contextId);
+    const { context, poolKey } = contextData;
+    const maxIdle = Number.isInteger(poolSize) ? poolSize : DEFAULT_POOL_SIZE;
+    const pooled = () => idleContexts.get(poolKey) || [];
+
+    if (pooled().includes(contextId)) {
+        return { status: 'released', contextId };
+    }
+
+    if (pooled().length >= maxIdle) {
+        return closeContext({ contextId });
+    }
+
+    // Drop per-session state before the context is handed out again. Web
+    // storage and IndexedDB are cleared for the page's current origin only
+    // (no walk over every origin the context has visited); a context whose
+    // storage cannot be cleared is closed instead of pooled.
+    const { page } = contextData;
+    let reset = true;
+    try {
+        const { protocol, origin } = new URL(page.url());
+        if (protocol === 'http:' || protocol === 'https:') {
+            await page.evaluate(() => {
+                localStorage.clear();
+                sessionStorage.clear();
+            });
+            contextData.cdp = contextData.cdp || await context.newCDPSession(page);
+            await contextData.cdp.send('Storage.clearDataForOrigin', {
+                origin,
+                storageTypes: 'indexeddb,cache_storage,service_workers'
+            });
+        }
+        await context.clearCookies();
+        await context.clearPermissions();
+        await page.goto('about:blank');
+        await page.setViewportSize(contextData.viewport);
+    } catch (error) {
+        console.error(`❌ Failed to reset browser context ${contextId}:`, error.message);
+        reset = false;
+    }
+
+    // Re-read the pool: concurrent releases may have changed it during the awaits
+    if (!contexts.has(contextId)) {
+        return { status: 'closed', contextId };
+    }
+
+    const idle = pooled();
+    if (idle.includes(contextId)) {
+        return { status: 'released', contextId };
+    }
+
+    if (!reset || idle.length >= maxIdle) {
+        return closeContext({ contextId });
+    }
+
+    idle.push(contextId);
+    idleContexts.set(poolKey, idle);
+
+    console.log(`✅ Released browser context to pool: ${contextId}`);
+
+    return { status: 'released', contextId };
+}
+
+// Navigate the context's page to a URL
+async function navigatePage({ contextId, url, waitUntil }) {
+    const { page } = validateContext(contextId);
+
+    await page.goto(url, {
+        waitUntil: waitUntil || 'networkidle',
+        timeout: 30000
+    });
+
+    const title = await page.title();
+
+    console.log(`✅ Navigated to: ${url}`);
+
+    return {
+        status: 'success',
+        url,
+        title
+    };
+}
+
+// Resize the context's page viewport (no reload)
+async function setViewportSize({ contextId, width, height }) {
+    const { page } = validateContext(contextId);
+
+    await page.setViewportSize({ width, height });
+
+    return {
+        status: 'success',
+        width,
+        height
+    };
+}
+
+// Screenshot the context's page into /artifacts/screenshots
+async function takeScreenshot({ contextId, path: filename, fullPage, type, quality }) {
+    const { page } = validateContext(contextId);
+
+    // Ensure screenshots directory exists
+    const screenshotDir = await ensureArtifactDir('screenshots');
+    const filepath = path.join(screenshotDir, filename || 'screenshot.png');
+
+    await page.screenshot({
+        path: filepath,
+        fullPage: fullPage !== undefined ? fullPage : true,
+        type: type || 'png',
+        // quality is only valid for lossy formats
+        ...(type === 'jpeg' && quality !== undefined ? { quality } : {})
+    });
+
+    console.log(`✅ Screenshot saved: ${filepath}`);
+
+    return {
+        status: 'success',
+        path: filepath,
+        filename
+    };
+}
+
+// Execute JavaScript in the context's page
+async function evaluateScript({ contextId, script }) {
+    const { page } = validateContext(contextId);
+
+    const result = await page.evaluate(script);
+
+    console.log(`✅ Evaluated script in context: ${contextId}`);
+
+    return {
+        status: 'success',
+        result
+    };
+}
+
 // ============================================================================
 // BROWSER CONTEXT MANAGEMENT
 // ============================================================================
@@ -140,36 +377,7 @@ app.get('/health', (req, res) => {
 // ============================================================================
 app.post('/browser/new', async (req, res) => {
     try {
-        const options = req.body.options || {};
-
-        // Create new context with options
-        const context = await browser.newContext({
-            viewport: options.viewport || { width: 1920, height: 1080 },
-            userAgent: options.userAgent,
-            locale: options.locale || 'en-US',
-            timezoneId: options.timezoneId,
-            ...options
-        });
-
-        // Create new page in context
-        const page = await context.newPage();
-
-        // Generate context ID and store
-        const contextId = generateContextId();
-        contexts.set(contextId, {
-            context,
-            page,
-            createdAt: new Date().toISOString(),
-            metadata: options.metadata || {}
-        });
-
-        console.log(`✅ Created browser context: ${contextId}`);
-
-        res.json({
-            contextId,
-            status: 'created',
-            viewport: options.viewport || { width: 1920, height: 1080 }
-        });
+        res.json(await createContext(req.body));
 
     } catch (error) {
         console.error('❌ Error creating browser context:', error);
@@ -186,21 +394,40 @@ app.post('/browser/new', async (req, res) => {
 // ============================================================================
 app.post('/browser/:id/close', async (req, res) => {
     try {
-        const contextId = req.params.id;
-        const contextData = validateContext(contextId);
+        res.json(await closeContext({ contextId: req.params.id }));
 
-        // Close context
-        await contextData.context.close();
+    } catch (error) {
+        console.error('❌ Error closing browser context:', error);
+        res.status(500).json({ error: error.message });
+    }
+});
 
-        // Remove from map
-        contexts.delete(contextId);
+// POST /browser/acquire
+// Get a browser context from the idle pool, creating one if none matches
+// Body: { options: { viewport, userAgent, etc. } }
+// Returns: { contextId, status: 'reused' | 'created' }
+// ============================================================================
+app.post('/browser/acquire', async (req, res) => {
+    try {
+        res.json(await acquireContext(req.body));
 
-        console.log(`✅ Closed browser context: ${contextId}`);
+    } catch (error) {
+        console.error('❌ Error acquiring browser context:', error);
+        res.status(500).json({ error: error.message });
+    }
+});
 
-        res.json({ status: 'closed', contextId });
+// POST /browser/:id/release
+// Reset a browser context and return it to the idle pool
+// Body: { poolSize } - idle contexts to keep; extra releases close the context
+// Returns: { status: 'released' | 'closed', contextId }
+// ============================================================================
+app.post('/browser/:id/release', async (req, res) => {
+    try {
+        res.json(await releaseContext({ ...req.body, contextId: req.params.id }));
 
     } catch (error) {
-        console.error('❌ Error closing browser context:', error);
+        console.error('❌ Error releasing browser context:', error);
         res.status(500).json({ error: error.message });
     }
 });
@@ -216,60 +443,139 @@ app.post('/browser/:id/close', async (req, res) => {
 // ============================================================================
 app.post('/navigate', async (req, res) => {
     try {
-        const { contextId, url, waitUntil } = req.body;
-        const { page } = validateContext(contextId);
+        res.json(await navigatePage(req.body));
 
-        await page.goto(url, {
-            waitUntil: waitUntil || 'networkidle',
-            timeout: 30000
-        });
-
-        const title = await page.title();
-
-        console.log(`✅ Navigated to: ${url}`);
+    } catch (error) {
+        console.error('❌ Error navigating:', error);
+        res.status(500).json({ error: error.message });
+    }
+});
 
-        res.json({
-            status: 'success',
-            url,
-            title
-        });
+// POST /viewport
+// Resize the page viewport without reloading
+// Body: { contextId, width, height }
+// Returns: { status, width, height }
+// ============================================================================
+app.post('/viewport', async (req, res) => {
+    try {
+        res.json(await setViewportSize(req.body));
 
     } catch (error) {
-        console.error('❌ Error navigating:', error);
+        console.error('❌ Error setting viewport:', error);
         res.status(500).json({ error: error.message });
     }
 });
 
 // POST /screenshot
 // Take screenshot
-// Body: { contextId, path, fullPage, type }
+// Body: { contextId, path, fullPage, type, quality }  (quality: jpeg only)
 // Returns: { status, path }
+//   With "Accept: application/octet-stream": the image bytes (streamed),
+//   artifact path in the X-Artifact-Path header
 // ============================================================================
 app.post('/screenshot', async (req, res) => {
     try {
-        const { contextId, path: filename, fullPage, type } = req.body;
-        const { page } = validateContext(contextId);
+        const result = await takeScreenshot(req.body);
+        if (wantsFile(req)) {
+            return sendArtifact(res, result.path);
+        }
+        res.json(result);
+
+    } catch (error) {
+        console.error('❌ Error taking screenshot:', error);
+        res.status(500).json({ error: error.message });
+    }
+});
 
-        // Ensure screenshots directory exists
-        const screenshotDir = await ensureArtifactDir('screenshots');
-        const filepath = path.join(screenshotDir, filename || 'screenshot.png');
+// Screenshot one URL at several viewports, resizing a single page
+async function screenshotViewports({ contextId, url, viewports, fullPage, type, quality, waitUntil }) {
+    const { page } = validateContext(contextId);
+    const screenshotDir = await ensureArtifactDir('screenshots');
+    const imageType = type || 'png';
+
+    // Single navigation; each viewport only resizes the same page
+    await page.goto(url, {
+        waitUntil: waitUntil || 'networkidle',
+        timeout: 30000
+    });
+    await page.evaluate(() => document.fonts.ready);
+
+    const screenshots = [];
+    for (const viewport of viewports) {
+        const { width, height, name } = viewport;
+        await page.setViewportSize({ width, height });
+
+        const filename = `${name}-${width}x${height}.${imageType}`;
+        const filepath = path.join(screenshotDir, filename);
 
         await page.screenshot({
             path: filepath,
             fullPage: fullPage !== undefined ? fullPage : true,
-            type: type || 'png'
+            type: imageType,
+            ...(imageType === 'jpeg' && quality !== undefined ? { quality } : {})
         });
 
-        console.log(`✅ Screenshot saved: ${filepath}`);
+        screenshots.push({ name, width, height, path: filepath, filename });
+    }
+
+    return screenshots;
+}
+
+// Screenshot one URL at several viewports concurrently, one pooled context
+// per viewport, so the page loads (and network-idle waits) overlap
+async function screenshotViewportsParallel({ url, viewports, fullPage, type, quality, waitUntil }) {
+    const imageType = type || 'png';
+
+    return Promise.all(viewports.map(async ({ width, height, name }) => {
+        const { contextId } = await acquireContext({ options: { viewport: { width, height } } });
+
+        try {
+            const filename = `${name}-${width}x${height}.${imageType}`;
+
+            await navigatePage({ contextId, url, waitUntil });
+            await contexts.get(contextId).page.evaluate(() => document.fonts.ready);
+            const { path: filepath } = await takeScreenshot({
+                contextId, path: filename, fullPage, type: imageType, quality
+            });
+
+            return { name, width, height, path: filepath, filename };
+        } finally {
+            await releaseContext({ contextId });
+        }
+    }));
+}
+
+// POST /screenshot/batch
+// Screenshot one URL at several viewport sizes
+// Body: { contextId, url, viewports: [{ width, height, name }], fullPage, type, quality,
+//         waitUntil, parallel }
+//   Default: navigate once in contextId and resize between screenshots.
+//   parallel: load the URL in one pooled context per viewport at the same
+//   time (contextId is not needed).
+// Returns: { status, url, screenshots: [{ name, width, height, path, filename }] }
+// ============================================================================
+app.post('/screenshot/batch', async (req, res) => {
+    try {
+        const { url, viewports, parallel } = req.body;
+
+        if (!Array.isArray(viewports) || viewports.length === 0) {
+            return res.status(400).json({ error: 'viewports must be a non-empty array' });
+        }
+
+        const screenshots = parallel
+            ? await screenshotViewportsParallel(req.body)
+            : await screenshotViewports(req.body);
+
+        console.log(`✅ Captured ${screenshots.length} viewports of: ${url}`);
 
         res.json({
             status: 'success',
-            path: filepath,
-            filename
+            url,
+            screenshots
         });
 
     } catch (error) {
-        console.error('❌ Error taking screenshot:', error);
+        console.error('❌ Error taking batch screenshots:', error);
         res.status(500).json({ error: error.message });
     }
 });
@@ -281,17 +587,7 @@ app.post('/screenshot', async (req, res) => {
 // ============================================================================
 app.post('/evaluate', async (req, res) => {
     try {
-        const { contextId, script } = req.body;
-        const { page } = validateContext(contextId);
-
-        const result = await page.evaluate(script);
-
-        console.log(`✅ Evaluated script in context: ${contextId}`);
-
-        res.json({
-            status: 'success',
-            result
-        });
+        res.json(await evaluateScript(req.body));
 
     } catch (error) {
         console.error('❌ Error evaluating script:', error);
@@ -303,6 +599,8 @@ app.post('/evaluate', async (req, res) => {
 // Generate PDF of page
 // Body: { contextId, path, format, landscape }
 // Returns: { status, path }
+//   With "Accept: application/octet-stream": the PDF bytes (streamed),
+//   artifact path in the X-Artifact-Path header
 // ============================================================================
 app.post('/pdf', async (req, res) => {
     try {
@@ -320,6 +618,10 @@ app.post('/pdf', async (req, res) => {
 
         console.log(`✅ PDF generated: ${filepath}`);
 
+        if (wantsFile(req)) {
+            return sendArtifact(res, filepath);
+        }
+
         res.json({
             status: 'success',
             path: filepath
@@ -357,6 +659,81 @@ app.post('/accessibility', async (req, res) => {
     }
 });
 
+// ============================================================================
+// BATCH ENDPOINT
+// ============================================================================
+
+// Operations available to POST /batch
+const batchOperations = {
+    'browser/new': createContext,
+    'browser/close': closeContext,
+    'browser/acquire': acquireContext,
+    'browser/release': releaseContext,
+    'navigate': navigatePage,
+    'viewport': setViewportSize,
+    'screenshot': takeScreenshot,
+    'evaluate': evaluateScript
+};
+
+// POST /batch
+// Run several dependent operations in one HTTP round trip
+// Body: { calls: [{ call_id, method, payload, input_from }] }
+//   input_from: index of an earlier call whose contextId is passed to this
+//   call. If that call did not succeed, this call is skipped with
+//   status INVALID_ARGUMENT.
+// Returns: { status, results: [{ call_id, status, result | error }] }
+//   status per call: OK, ERROR, INVALID_ARGUMENT
+// ============================================================================
+app.post('/batch', async (req, res) => {
+    const calls = req.body.calls;
+
+    if (!Array.isArray(calls)) {
+        return res.status(400).json({ error: 'calls must be an array' });
+    }
+
+    const results = [];
+
+    for (const [index, call] of calls.entries()) {
+        const { call_id, method, input_from } = call;
+        const payload = { ...(call.payload || {}) };
+        const operation = batchOperations[method];
+
+        if (!operation) {
+            results.push({ call_id, status: 'INVALID_ARGUMENT', error: `Unknown method: ${method}` });
+            continue;
+        }
+
+        if (input_from !== undefined && input_from !== null) {
+            const source = results[input_from];
+            if (!(input_from < index) || !source || source.status !== 'OK') {
+                results.push({
+                    call_id,
+                    status: 'INVALID_ARGUMENT',
+                    error: `Input call ${input_from} did not succeed`
+                });
+                continue;
+            }
+            payload.contextId = source.contextId;
+        }
+
+        try {
+            const result = await operation(payload);
+            results.push({
+                call_id,
+                status: 'OK',
+                result,
+                // Context the call ran in, for calls that reference it via input_from
+                contextId: result.contextId || payload.contextId
+            });
+        } catch (error) {
+            console.error(`❌ Batch call ${call_id} (${method}) failed:`, error);
+            results.push({ call_id, status: 'ERROR', error: error.message });
+        }
+    }
+
+    res.json({ status: 'success', results });
+});
+
 // ============================================================================
 // ERROR HANDLING
 // ============================================================================
@@ -397,6 +774,7 @@ async function cleanup() {
         }
     }
     contexts.clear();
+    idleContexts.clear();
 
     // Close browser
     if (browser) {
@@ -430,7 +808,7 @@ async function startServer() {
         await initBrowser();
 
         // Start HTTP server
-        app.listen(PORT, HOST, () => {
+        const server = app.listen(PORT, HOST, () => {
             console.log('');
             console.log('🎭 Playwright HTTP Server');
             console.log('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
@@ -442,6 +820,11 @@ async function startServer() {
             console.log('');
         });
 
+        // Keep idle client connections open well beyond Node's 5s default so
+        // pooled keep-alive sockets survive between client polls/requests
+        server.keepAliveTimeout = 65000;
+        server.headersTimeout = 66000; // must exceed keepAliveTimeout
+
     } catch (error) {
         console.error('❌ Failed to start server:', error);
         process.exit(1);
@@ -12,6 +12,7 @@ This shows:
 """
 
 import sys
+import logging
 sys.path.insert(0, '/workspaces/claude_in_devcontainer')
 
 from web_ui_optimizer import UIOptimizer, wait_for_playwright_service
@@ -19,6 +20,10 @@ from web_ui_optimizer import UIOptimizer, wait_for_playwright_service
 def main():
     url = sys.argv[1] if len(sys.argv) > 1 else "https://example.com"
 
+    # Show UIOptimizer's progress messages (service wait messages stay quiet)
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger(UIOptimizer.__module__).setLevel(logging.INFO)
+
     print(f"🔍 Analyzing: {url}")
     print()
 
@@ -49,8 +54,8 @@ def main():
         print(f"Issues found:")
         print(f"   - Images without alt text: {len(a11y.get('images_without_alt', []))}")
         print(f"   - Form inputs without labels: {len(a11y.get('missing_labels', []))}")
-        print(f"   - Total headings: {len(a11y.get('heading_structure', []))}")
-        print(f"   - Links without text: {len(a11y.get('links_without_text', []))}")
+        print(f"   - Total headings: {a11y.get('heading_structure', {}).get('count', 0)}")
+        print(f"   - Links without text: {a11y.get('links_without_text', {}).get('count', 0)}")
         print()
 
         # Measure performance
@@ -8,6 +8,7 @@ using a Playwright service running in a separate Docker container.
 
 Main Components:
     - RemotePlaywright: Low-level HTTP client for Playwright API
+    - AsyncRemotePlaywright: asyncio version of RemotePlaywright
     - UIOptimizer: High-level toolkit for UI testing and optimization
     - Connection utilities: Helper functions for service connectivity
 
@@ -35,30 +36,56 @@ Usage:
         verify_connection(verbose=True)
 """
 
+import importlib
+
 __version__ = "2.0.0"
 __author__ = "Claude Code DevContainer Project"
 
-# Export main classes and functions
-from .remote_playwright import (
-    RemotePlaywright,
-    PlaywrightError,
-    PlaywrightConnectionError,
-    PlaywrightContextError,
-    quick_screenshot
-)
+# Exports are resolved lazily (PEP 562) so that importing one entry point,
+# e.g. RemotePlaywright, does not load the other submodules.
+_LAZY_EXPORTS = {
+    # remote_playwright
+    "RemotePlaywright": "remote_playwright",
+    "PlaywrightError": "remote_playwright",
+    "PlaywrightConnectionError": "remote_playwright",
+    "PlaywrightContextError": "remote_playwright",
+    "quick_screenshot": "remote_playwright",
+
+    # async_remote_playwright
+    "AsyncRemotePlaywright": "async_remote_playwright",
+    "quick_screenshot_async": "async_remote_playwright",
+
+    # ui_optimizer
+    "UIOptimizer": "ui_optimizer",
+
+    # connection
+    "wait_for_playwright_service": "connection",
+    "wait_for_playwright_service_async": "connection",
+    "check_service_health": "connection",
+    "HealthStatus": "connection",
+    "get_service_info": "connection",
+    "verify_connection": "connection",
+}
+
 
-from .ui_optimizer import UIOptimizer
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
-from .connection import (
-    wait_for_playwright_service,
-    check_service_health,
-    get_service_info,
-    verify_connection
-)
 
 __all__ = [
     # Main classes
     "RemotePlaywright",
+    "AsyncRemotePlaywright",
     "UIOptimizer",
 
     # Exceptions
@@ -66,9 +93,14 @@ __all__ = [
     "PlaywrightConnectionError",
     "PlaywrightContextError",
 
+    # Data classes
+    "HealthStatus",
+
     # Utility functions
     "quick_screenshot",
+    "quick_screenshot_async",
     "wait_for_playwright_service",
+    "wait_for_playwright_service_async",
     "check_service_health",
     "get_service_info",
     "verify_connection",
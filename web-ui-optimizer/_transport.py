@@ -0,0 +1,39 @@
+"""
+HTTP Transport Helpers
+======================
+Socket tuning and JSON codec shared by the Playwright service clients
+(remote_playwright and connection).
+"""
+
+import socket
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    _loads = json.loads
+
+
+# Small JSON calls dominate the API: send each immediately (no Nagle delay)
+# and keep idle pooled sockets alive between requests and polls
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that applies _SOCKET_OPTIONS to every pooled connection"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
@@ -0,0 +1,229 @@
+"""
+Async Remote Playwright Client
+==============================
+asyncio interface to the Playwright service container.
+
+AsyncRemotePlaywright mirrors RemotePlaywright with awaitable methods.
+Each call runs the blocking HTTP request in a worker thread, so many
+workflows (e.g. slow networkidle navigations) can be awaited concurrently
+with asyncio.gather while sharing one keep-alive session.
+
+Usage:
+    import asyncio
+    from async_remote_playwright import AsyncRemotePlaywright
+
+    async def main():
+        async with AsyncRemotePlaywright() as pw:
+            await pw.acquire_context()
+            await pw.navigate("https://example.com")
+            await pw.screenshot("output.png", full_page=True)
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import os
+from typing import Optional, Dict, Any, List
+
+from remote_playwright import RemotePlaywright, PlaywrightError, quick_screenshot
+
+
+class AsyncRemotePlaywright:
+    """asyncio client for remote Playwright service"""
+
+    __slots__ = ("_pw",)
+
+    def __init__(
+        self,
+        service_url: Optional[str] = None,
+        timeout: Optional[float] = 60.0,
+        context_pool_size: int = 4,
+        pool_maxsize: Optional[int] = None,
+        health_ttl: float = 2.0
+    ):
+        """
+        Initialize async Playwright client
+
+        Args:
+            service_url: URL of Playwright service (default: from env or http://playwright:3000)
+            timeout: Request timeout in seconds (None waits indefinitely)
+            context_pool_size: Idle contexts the service keeps for reuse on release
+            pool_maxsize: Keep-alive connections to the service (default: from env or 20)
+            health_ttl: Seconds a health_check() result is reused
+        """
+        self._pw = RemotePlaywright(
+            service_url=service_url,
+            timeout=timeout,
+            context_pool_size=context_pool_size,
+            pool_maxsize=pool_maxsize,
+            health_ttl=health_ttl
+        )
+
+    @property
+    def service_url(self) -> str:
+        return self._pw.service_url
+
+    @property
+    def context_id(self) -> Optional[str]:
+        return self._pw.context_id
+
+    async def health_check(self, force: bool = False) -> Dict[str, Any]:
+        """Check service health (cached for health_ttl seconds)"""
+        return await asyncio.to_thread(self._pw.health_check, force)
+
+    async def new_context(self, options: Optional[Dict[str, Any]] = None) -> str:
+        """Create new browser context"""
+        return await asyncio.to_thread(self._pw.new_context, options)
+
+    async def acquire_context(self, options: Optional[Dict[str, Any]] = None) -> str:
+        """Get a browser context from the service's idle pool"""
+        return await asyncio.to_thread(self._pw.acquire_context, options)
+
+    async def release_context(self) -> Dict[str, Any]:
+        """Return the active browser context to the service's idle pool"""
+        return await asyncio.to_thread(self._pw.release_context)
+
+    async def navigate(self, url: str, wait_until: str = "networkidle") -> Dict[str, Any]:
+        """Navigate to URL"""
+        return await asyncio.to_thread(self._pw.navigate, url, wait_until)
+
+    async def set_viewport_size(self, width: int, height: int) -> Dict[str, Any]:
+        """Resize the page viewport without reloading"""
+        return await asyncio.to_thread(self._pw.set_viewport_size, width, height)
+
+    async def screenshot(
+        self,
+        path: str,
+        full_page: bool = False,
+        type: str = "png",
+        download_to: Optional[str] = None,
+        quality: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Take screenshot"""
+        return await asyncio.to_thread(
+            self._pw.screenshot, path, full_page, type, download_to, quality
+        )
+
+    async def screenshot_batch(
+        self,
+        url: str,
+        viewports: List[Dict[str, Any]],
+        full_page: bool = True,
+        type: str = "png",
+        wait_until: str = "networkidle",
+        quality: Optional[int] = None,
+        parallel: bool = False
+    ) -> Dict[str, Any]:
+        """Navigate once and take a screenshot at each viewport size"""
+        return await asyncio.to_thread(
+            self._pw.screenshot_batch, url, viewports, full_page, type, wait_until, quality,
+            parallel
+        )
+
+    async def evaluate(self, script: str) -> Dict[str, Any]:
+        """Execute JavaScript in page context"""
+        return await asyncio.to_thread(self._pw.evaluate, script)
+
+    async def evaluate_cached(self, script: str) -> Dict[str, Any]:
+        """Execute a constant JavaScript snippet, reusing its serialized request body"""
+        return await asyncio.to_thread(self._pw.evaluate_cached, script)
+
+    async def pdf(
+        self,
+        path: str = "page.pdf",
+        format: str = "A4",
+        landscape: bool = False,
+        download_to: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate PDF of the current page"""
+        return await asyncio.to_thread(self._pw.pdf, path, format, landscape, download_to)
+
+    async def batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several dependent operations in a single request"""
+        return await asyncio.to_thread(self._pw.batch, calls)
+
+    async def flush(self):
+        """Send all queued (coalesced) calls as one /batch request"""
+        await asyncio.to_thread(self._pw.flush)
+
+    async def map_screenshots(
+        self,
+        urls: List[str],
+        out_dir: str,
+        max_workers: int = 8,
+        full_page: bool = True
+    ) -> List[str]:
+        """
+        Screenshot many URLs concurrently
+
+        Each URL is captured in its own pooled browser context; at most
+        max_workers captures run at once, awaited together with asyncio.gather.
+
+        Args:
+            urls: URLs to capture
+            out_dir: Local directory to stream the screenshots to
+            max_workers: Maximum concurrent URLs
+            full_page: Capture full scrollable page
+
+        Returns:
+            Local screenshot paths, in the same order as urls
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        # One keep-alive connection per worker
+        if max_workers > self._pw._pool_maxsize:
+            self._pw._mount_adapters(max_workers)
+
+        limit = asyncio.Semaphore(max_workers)
+
+        async def capture(i: int, url: str) -> str:
+            async with limit:
+                return await asyncio.to_thread(self._pw._capture_url, i, url, out_dir, full_page)
+
+        return await asyncio.gather(*[capture(i, url) for i, url in enumerate(urls)])
+
+    async def close(self) -> Dict[str, Any]:
+        """Close browser context"""
+        return await asyncio.to_thread(self._pw.close)
+
+    close_context = close
+
+    async def close_session(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self._pw.close_session()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: release any active context, then close the session"""
+        try:
+            await self.flush()
+            if self.context_id:
+                await self.release_context()
+        except PlaywrightError as e:
+            print(f"Warning: Error releasing browser context: {e}")
+        finally:
+            await self.close_session()
+
+
+async def quick_screenshot_async(
+    url: str,
+    path: str = "screenshot.png",
+    full_page: bool = True,
+    service_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Take a screenshot of a URL in a single round trip, without blocking the event loop
+
+    Args:
+        url: URL to capture
+        path: Filename for screenshot
+        full_page: Capture full scrollable page
+        service_url: URL of Playwright service (default: from env)
+
+    Returns:
+        Screenshot result
+    """
+    return await asyncio.to_thread(quick_screenshot, url, path, full_page, service_url)
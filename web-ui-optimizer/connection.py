@@ -2,52 +2,594 @@
 Playwright Service Connection Utilities
 =======================================
 Helper functions for connecting to the Playwright service.
+
+All helpers share one module-level requests.Session so that repeated
+health polls reuse the same keep-alive connection instead of opening a
+new TCP connection per probe.
 """
 
 import os
+import sys
+import argparse
 import time
+import socket
+import asyncio
+import atexit
+import copy
+import logging
+import functools
+import contextlib
+import threading
+import urllib.parse
+from dataclasses import dataclass, field
 import requests
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
+
+from _transport import _KeepAliveAdapter, _loads
+
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session for all health probes (keep-alive connection reuse)
+_SESSION = requests.Session()
+
+
+def configure_pool(maxsize: int):
+    """
+    Set the connection pool size of the shared session
+
+    The previously mounted adapter is closed along with its connections.
+
+    Args:
+        maxsize: Maximum number of pooled connections per host
+    """
+    previous = _SESSION.adapters.get("http://")
+    _SESSION.mount("http://", _KeepAliveAdapter(pool_connections=8, pool_maxsize=maxsize))
+    if previous is not None:
+        previous.close()
+
+
+configure_pool(int(os.environ.get('PLAYWRIGHT_POOL_MAXSIZE', '32')))
+
+
+def close_session():
+    """Close the shared HTTP session used for health probes"""
+    _SESSION.close()
+
+
+atexit.register(close_session)
+
+# Retry backoff between failed probes (seconds): doubles up to the cap
+_INITIAL_BACKOFF = 0.1
+_MAX_BACKOFF = 5.0
+
+# Per-probe (connect, read) timeout in seconds: fail fast, keep overall budget
+_PROBE_TIMEOUT = (1.0, 2.0)
+
+# Timeout for the raw TCP connect check that precedes each wait-loop probe
+_TCP_PROBE_TIMEOUT = 0.2
+
+# Last parsed /health response per health URL: (monotonic timestamp, data)
+_HEALTH_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_HEALTH_CACHE_TTL = 0.5
+
+# Health URLs that rejected HEAD with 405 (probe with GET only)
+_HEAD_UNSUPPORTED = set()
+
+# Wait-loop messages (%-style, formatted lazily by logging)
+_MSG_WAITING_FOR = "Waiting for Playwright service at %s..."
+_MSG_WAITING = "⏳ Waiting for Playwright service... (attempt %d)"
+_MSG_READY = "✅ Playwright service ready!\n   Status: %s\n   Browser: %s"
+_MSG_UNAVAILABLE = "Playwright service not available after %d attempts"
+
+# Health URL -> monotonic time until which a successful wait is reused
+_READY_UNTIL: Dict[str, float] = {}
+
+# Only one wait-loop probe in flight at a time (shared by sync and async waits)
+_PROBE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class HealthStatus:
+    """Parsed /health response of the Playwright service"""
+
+    status: str
+    browser_running: bool
+    browser_version: str
+    browser_contexts: int
+    uptime: float
+    memory_used: int
+    memory_total: int
+    raw: Dict[str, Any] = field(repr=False, compare=False)
+
+    @property
+    def healthy(self) -> bool:
+        return self.status == 'healthy'
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the original health dictionary"""
+        return dict(self.raw)
+
+
+def _parse_health(data: Dict[str, Any]) -> HealthStatus:
+    """Build a HealthStatus from a parsed /health response"""
+    browser = data.get('browser') or {}
+    memory = data.get('memory') or {}
+    return HealthStatus(
+        status=data.get('status', 'unknown'),
+        browser_running=bool(browser.get('running')),
+        browser_version=browser.get('version', 'Unknown'),
+        browser_contexts=browser.get('contexts', 0),
+        uptime=data.get('uptime', 0.0),
+        memory_used=memory.get('used', 0),
+        memory_total=memory.get('total', 0),
+        raw=dict(data)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_service_url(service_url: Optional[str]) -> str:
+    """Resolve the service base URL (argument, env, or default)"""
+    url = service_url or os.environ.get(
+        'PLAYWRIGHT_SERVICE_URL',
+        'http://playwright:3000'
+    )
+    return url.rstrip('/')
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_health_url(service_url: Optional[str]) -> str:
+    """Resolve the full /health endpoint URL for a service URL"""
+    return f"{_resolve_service_url(service_url)}/health"
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_address(url: str) -> Tuple[str, int]:
+    """Parse (host, port) from a service URL"""
+    parsed = urllib.parse.urlparse(url)
+    default_port = 443 if parsed.scheme == 'https' else 80
+    return parsed.hostname, parsed.port or default_port
+
+
+def _tcp_probe(host: str, port: int, timeout: float = _TCP_PROBE_TIMEOUT) -> bool:
+    """Check whether a TCP connection to host:port can be opened"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        # Refused, timed out, or DNS not resolvable yet (service not up)
+        return False
+
+
+@functools.lru_cache(maxsize=8)
+def _prepare_probe(method: str, url: str) -> requests.PreparedRequest:
+    """
+    Build a reusable prepared health request
+
+    Re-sending the same PreparedRequest skips URL parsing and header merging
+    on every poll. Note that Session.send() does not apply proxy settings
+    from the environment; the service is reached over the Docker network.
+    """
+    return _SESSION.prepare_request(requests.Request(method, url))
+
+
+# Active verbose waits and the logger settings to restore after the last one
+_VERBOSE_LOCK = threading.Lock()
+_verbose_waits = 0
+_verbose_restore: Optional[Tuple[Optional[logging.Handler], int, bool]] = None
+
+
+@contextlib.contextmanager
+def _verbose_logging(verbose: bool):
+    """
+    Temporarily print this module's INFO logs to stdout
+
+    Keeps the verbose flag working for callers that have not configured
+    logging; if a handler is already set up (e.g. logging.basicConfig), it
+    only raises the level so each message is emitted once. Overlapping
+    verbose waits share one setup, restored when the last one finishes.
+    """
+    global _verbose_waits, _verbose_restore
+
+    if not verbose:
+        yield
+        return
+
+    with _VERBOSE_LOCK:
+        if _verbose_waits == 0:
+            handler = None
+            if not logger.hasHandlers():
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+            _verbose_restore = (handler, logger.level, logger.propagate)
+            if handler is not None:
+                logger.addHandler(handler)
+                logger.propagate = False
+            if not logger.isEnabledFor(logging.INFO):
+                logger.setLevel(logging.INFO)
+        _verbose_waits += 1
+    try:
+        yield
+    finally:
+        with _VERBOSE_LOCK:
+            _verbose_waits -= 1
+            if _verbose_waits == 0:
+                handler, level, propagate = _verbose_restore
+                if handler is not None:
+                    logger.removeHandler(handler)
+                logger.setLevel(level)
+                logger.propagate = propagate
+                _verbose_restore = None
+
+
+def _log_ready(data: Dict[str, Any]):
+    """Log the service-ready summary (skips dict lookups when INFO is off)"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_MSG_READY, data.get('status'), data.get('browser', {}).get('version'))
+
+
+def _fetch_health(
+    health_url: str,
+    probe_timeout: Tuple[float, float],
+    max_age: float = 0
+) -> Dict[str, Any]:
+    """
+    Fetch and parse /health, reusing a cached response younger than max_age
+
+    Every successful fetch refreshes the cache, so a fresh check followed by
+    a cached read costs a single HTTP round-trip. Callers always get their
+    own copy, so changing a result never alters the cached response.
+    """
+    cached = _HEALTH_CACHE.get(health_url)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return copy.deepcopy(cached[1])
+
+    response = _SESSION.send(_prepare_probe('GET', health_url), timeout=probe_timeout)
+    response.raise_for_status()
+    data = _loads(response.content)
+    _HEALTH_CACHE[health_url] = (time.monotonic(), copy.deepcopy(data))
+    return data
+
+
+def _probe_health(
+    health_url: str,
+    probe_timeout: Tuple[float, float]
+) -> Optional[Dict[str, Any]]:
+    """
+    Run a single health probe, returning the parsed body or None if not ready
+
+    Probes are serialized through _PROBE_LOCK so overlapping waits (e.g. a
+    supervisor polling on a timer) never have more than one probe in flight.
+    Callers that need concurrent probes should use their own HTTP client.
+    """
+    with _PROBE_LOCK:
+        # Fast path: while the service is still starting, most probes fail
+        # at TCP connect - detect that without going through requests/urllib3
+        if not _tcp_probe(*_resolve_address(health_url)):
+            return None
+
+        try:
+            # Liveness via HEAD (no body); only the final, successful probe
+            # downloads and parses the JSON. Express answers HEAD on GET
+            # routes; services that reply 405 fall back to GET from then on.
+            if health_url not in _HEAD_UNSUPPORTED:
+                response = _SESSION.send(
+                    _prepare_probe('HEAD', health_url),
+                    timeout=probe_timeout
+                )
+                if response.status_code == 405:
+                    _HEAD_UNSUPPORTED.add(health_url)
+                elif response.status_code != 200:
+                    return None
+
+            return _fetch_health(health_url, probe_timeout)
+        except (requests.exceptions.RequestException, ValueError):
+            return None
 
 
 def wait_for_playwright_service(
     max_retries: int = 30,
     delay: int = 2,
-    service_url: Optional[str] = None
+    service_url: Optional[str] = None,
+    verbose: bool = True,
+    probe_timeout: Tuple[float, float] = _PROBE_TIMEOUT,
+    force: bool = False,
+    ready_ttl: float = 30.0
 ) -> bool:
     """
     Wait for Playwright service to be ready
 
+    Probes start 100 ms apart and back off exponentially (capped at 5 s).
+    The overall wait budget is max_retries * delay seconds.
+
     Args:
-        max_retries: Maximum number of retry attempts
-        delay: Seconds to wait between retries
+        max_retries: Maximum number of retry attempts (sets the wait budget)
+        delay: Seconds per retry attempt (sets the wait budget)
         service_url: URL of service (default: from env)
+        verbose: Print progress messages
+        probe_timeout: (connect, read) timeout for each probe in seconds
+        force: Probe even if the service was seen ready within ready_ttl
+        ready_ttl: Seconds a successful wait is remembered for this URL
 
     Returns:
         True if service is ready, raises Exception otherwise
     """
-    url = service_url or os.environ.get(
-        'PLAYWRIGHT_SERVICE_URL',
-        'http://playwright:3000'
+    url = _resolve_service_url(service_url)
+    health_url = _resolve_health_url(service_url)
+
+    if not force and time.monotonic() < _READY_UNTIL.get(health_url, 0.0):
+        return True
+
+    with _verbose_logging(verbose):
+        _wait_loop(url, health_url, max_retries, delay, probe_timeout)
+
+    _READY_UNTIL[health_url] = time.monotonic() + ready_ttl
+    return True
+
+
+def _wait_loop(
+    url: str,
+    health_url: str,
+    max_retries: int,
+    delay: int,
+    probe_timeout: Tuple[float, float]
+) -> bool:
+    """Synchronous retry loop behind wait_for_playwright_service"""
+    logger.info(_MSG_WAITING_FOR, url)
+
+    # Overall budget stays max_retries * delay; probes start fast and back off
+    deadline = time.monotonic() + max_retries * delay
+    backoff = _INITIAL_BACKOFF
+    attempt = 0
+
+    while True:
+        attempt += 1
+        data = _probe_health(health_url, probe_timeout)
+        if data is not None:
+            _log_ready(data)
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        logger.info(_MSG_WAITING, attempt)
+        time.sleep(min(backoff, remaining))
+        backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    raise Exception(_MSG_UNAVAILABLE % attempt)
+
+
+async def wait_for_playwright_service_async(
+    max_retries: int = 30,
+    delay: int = 2,
+    service_url: Optional[str] = None,
+    verbose: bool = True,
+    probe_timeout: Tuple[float, float] = _PROBE_TIMEOUT,
+    force: bool = False,
+    ready_ttl: float = 30.0
+) -> bool:
+    """
+    Wait for Playwright service to be ready without blocking the event loop
+
+    Same behaviour and arguments as wait_for_playwright_service (including
+    the ready_ttl short-circuit), so several readiness checks can run
+    concurrently with asyncio.gather(). Probes run in a worker thread over
+    the shared session.
+
+    Returns:
+        True if service is ready, raises Exception otherwise
+    """
+    url = _resolve_service_url(service_url)
+    health_url = _resolve_health_url(service_url)
+
+    if not force and time.monotonic() < _READY_UNTIL.get(health_url, 0.0):
+        return True
+
+    with _verbose_logging(verbose):
+        await _wait_loop_async(url, health_url, max_retries, delay, probe_timeout)
+
+    _READY_UNTIL[health_url] = time.monotonic() + ready_ttl
+    return True
+
+
+async def _wait_loop_async(
+    url: str,
+    health_url: str,
+    max_retries: int,
+    delay: int,
+    probe_timeout: Tuple[float, float]
+) -> bool:
+    """Asynchronous retry loop behind wait_for_playwright_service_async"""
+    logger.info(_MSG_WAITING_FOR, url)
+
+    deadline = time.monotonic() + max_retries * delay
+    backoff = _INITIAL_BACKOFF
+    attempt = 0
+
+    while True:
+        attempt += 1
+        # Bounded by the probe's own socket timeouts; an outer asyncio timeout
+        # would abandon the worker thread while it still holds _PROBE_LOCK
+        data = await asyncio.to_thread(_probe_health, health_url, probe_timeout)
+
+        if data is not None:
+            _log_ready(data)
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        logger.info(_MSG_WAITING, attempt)
+        await asyncio.sleep(min(backoff, remaining))
+        backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    raise Exception(_MSG_UNAVAILABLE % attempt)
+
+
+def check_service_health(
+    service_url: Optional[str] = None,
+    probe_timeout: Tuple[float, float] = _PROBE_TIMEOUT
+) -> HealthStatus:
+    """
+    Fetch the Playwright service health status
+
+    Args:
+        service_url: URL of service (default: from env)
+        probe_timeout: (connect, read) timeout in seconds
+
+    Returns:
+        HealthStatus (use .as_dict() for the raw health dictionary)
+    """
+    health_url = _resolve_health_url(service_url)
+    return _parse_health(_fetch_health(health_url, probe_timeout, max_age=0))
+
+
+def get_service_info(
+    service_url: Optional[str] = None,
+    probe_timeout: Tuple[float, float] = _PROBE_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Get Playwright service information
+
+    Args:
+        service_url: URL of service (default: from env)
+        probe_timeout: (connect, read) timeout in seconds
+
+    Returns:
+        Health status dictionary including the resolved service URL
+    """
+    url = _resolve_service_url(service_url)
+    health_url = _resolve_health_url(service_url)
+    return dict(
+        _fetch_health(health_url, probe_timeout, max_age=_HEALTH_CACHE_TTL),
+        service_url=url
     )
 
-    print(f"Waiting for Playwright service at {url}...")
 
-    for i in range(max_retries):
-        try:
-            response = requests.get(f"{url}/health", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Playwright service ready!")
-                print(f"   Status: {data.get('status')}")
-                print(f"   Browser: {data.get('browser', {}).get('version')}")
-                return True
-        except requests.exceptions.RequestException as e:
-            print(f"⏳ Waiting for Playwright service... ({i+1}/{max_retries})")
-            time.sleep(delay)
+def verify_connection(
+    service_url: Optional[str] = None,
+    verbose: bool = True,
+    probe_timeout: Tuple[float, float] = _PROBE_TIMEOUT
+) -> bool:
+    """
+    Verify connectivity to the Playwright service
+
+    Args:
+        service_url: URL of service (default: from env)
+        verbose: Print check results
+        probe_timeout: (connect, read) timeout in seconds
+
+    Returns:
+        True if all checks passed, False otherwise
+    """
+    url = _resolve_service_url(service_url)
+    health_url = _resolve_health_url(service_url)
+
+    if verbose:
+        print(f"🔍 Verifying connection to {url}...")
+
+    # Check 1: Service reachable
+    try:
+        data = _fetch_health(health_url, probe_timeout, max_age=0)
+    except requests.exceptions.Timeout as e:
+        if verbose:
+            print(f"❌ Service timed out (connect/read {probe_timeout}s): {e}")
+        return False
+    except requests.exceptions.RequestException as e:
+        if verbose:
+            print(f"❌ Service not reachable: {e}")
+        return False
+    except ValueError as e:
+        if verbose:
+            print(f"❌ Invalid health response: {e}")
+        return False
+
+    if verbose:
+        print("✅ Service reachable")
+
+    return _verify_from_health(_parse_health(data), verbose)
+
+
+def _verify_from_health(health: HealthStatus, verbose: bool = True) -> bool:
+    """
+    Run the verification checks against an already-fetched health response
+
+    Args:
+        health: Parsed /health response
+        verbose: Print check results
+
+    Returns:
+        True if all checks passed, False otherwise
+    """
+    # Check 2: Service healthy
+    if not health.healthy:
+        if verbose:
+            print(f"❌ Service unhealthy: {health.status}")
+        return False
+
+    if verbose:
+        print("✅ Service healthy")
+
+    # Check 3: Browser running
+    if not health.browser_running:
+        if verbose:
+            print("❌ Browser not running")
+        return False
+
+    if verbose:
+        print(f"✅ Browser running: {health.browser_version}")
+
+    # Check 4: Active contexts
+    if verbose:
+        print(f"   Active contexts: {health.browser_contexts}")
+
+    return True
+
+
+def test_connection_script():
+    """Command-line entry point: wait for the service, then verify it"""
+    parser = argparse.ArgumentParser(
+        description="Test connectivity to the Playwright service"
+    )
+    parser.add_argument(
+        "--url",
+        help="Service URL (default: $PLAYWRIGHT_SERVICE_URL or http://playwright:3000)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=_PROBE_TIMEOUT[1],
+        help="Per-probe read timeout in seconds"
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=30,
+        help="Retry budget while waiting for the service"
+    )
+    args = parser.parse_args()
+
+    # Resolve once and pass explicitly to every helper
+    url = _resolve_service_url(args.url)
+    probe_timeout = (_PROBE_TIMEOUT[0], args.timeout)
+
+    try:
+        wait_for_playwright_service(
+            max_retries=args.max_retries,
+            service_url=url,
+            probe_timeout=probe_timeout
+        )
+    except Exception as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
-    raise Exception(f"Playwright service not available after {max_retries} attempts")
+    print()
+    if not verify_connection(service_url=url, probe_timeout=probe_timeout):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    wait_for_playwright_service()
+    test_connection_script()
@@ -20,36 +20,325 @@ Usage:
 """
 
 import os
+import re
+import functools
+import shutil
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple
+
+from _transport import _KeepAliveAdapter, _dumps, _loads
+
+
+__all__ = [
+    "RemotePlaywright",
+    "PlaywrightError",
+    "PlaywrightConnectionError",
+    "PlaywrightContextError",
+    "quick_screenshot",
+]
+
+
+class _Retry(Retry):
+    """Retry that never repeats a request whose response timed out"""
+
+    def increment(
+        self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None
+    ):
+        # The service may still be working on the first attempt (e.g. a slow
+        # /screenshot/batch): spend no retry, let the read error propagate
+        if isinstance(error, ReadTimeoutError):
+            no_read_retry = self.new(read=0)
+            return Retry.increment(no_read_retry, method, url, response, error, _pool, _stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+# Transport-level retry policy: 0.5s, 1s, 2s backoff on connection errors and
+# on 502/503/504 (honouring Retry-After); the final response is returned so
+# _request can report the service's error message. One read retry covers a
+# pooled keep-alive socket the service had already closed; read timeouts are
+# not retried (see _Retry).
+_RETRY = _Retry(
+    total=3,
+    read=1,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Endpoint prefixes that are not safe to repeat (create/close contexts, run
+# arbitrary scripts); these are mounted with a retry-free adapter
+_NON_IDEMPOTENT_ENDPOINTS = ("/browser/", "/evaluate", "/batch")
+
+
+class PlaywrightError(Exception):
+    """Base exception for Playwright service errors"""
+
+
+class PlaywrightConnectionError(PlaywrightError):
+    """Raised when the Playwright service cannot be reached"""
+
+
+class PlaywrightContextError(PlaywrightError, ValueError):
+    """Raised when an operation requires an active browser context"""
+
+
+_NO_CTX_MSG = "No active context. Call new_context() or acquire_context() first."
+
+
+def _requires_context(method):
+    """
+    Raise PlaywrightContextError if the client has no active browser context
+
+    Calls queued with queue_evaluate() are flushed first, so they run in the
+    context (and page state) they were queued for, before the direct call.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.context_id is None:
+            raise PlaywrightContextError(_NO_CTX_MSG)
+        self.flush()
+        return method(self, *args, **kwargs)
+    return wrapper
 
 
 class RemotePlaywright:
     """Client for remote Playwright service"""
 
-    def __init__(self, service_url: Optional[str] = None):
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "service_url",
+        "timeout",
+        "context_id",
+        "context_pool_size",
+        "health_ttl",
+        "_health_cache",
+        "_session",
+        "_pool_maxsize",
+        "_coalesce_window",
+        "_pending",
+        "_pending_lock",
+        "_first_queued",
+        "_flush_timer",
+        "_payload_cache",
+    )
+
+    def __init__(
+        self,
+        service_url: Optional[str] = None,
+        timeout: Optional[float] = 60.0,
+        context_pool_size: int = 4,
+        pool_maxsize: Optional[int] = None,
+        health_ttl: float = 2.0
+    ):
         """
         Initialize Playwright client
 
         Args:
             service_url: URL of Playwright service (default: from env or http://playwright:3000)
+            timeout: Request timeout in seconds (None waits indefinitely)
+            context_pool_size: Idle contexts the service keeps for reuse on release
+            pool_maxsize: Keep-alive connections to the service, i.e. concurrent
+                requests without opening new sockets (default: from env or 20)
+            health_ttl: Seconds a health_check() result is reused
         """
-        self.service_url = service_url or os.environ.get(
+        # Normalized once so request URLs are plain concatenation
+        self.service_url = (service_url or os.environ.get(
             'PLAYWRIGHT_SERVICE_URL',
             'http://playwright:3000'
-        )
+        )).rstrip('/')
+        self.timeout = timeout
         self.context_id: Optional[str] = None
+        self.context_pool_size = context_pool_size
+        self.health_ttl = health_ttl
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # Persistent session: all API calls reuse pooled keep-alive connections.
+        # Transient failures are retried with exponential backoff, except on
+        # endpoints where repeating a request would change state twice.
+        self._session = requests.Session()
+        # Bodies are pre-serialized with _dumps, so the type is set once here
+        self._session.headers["Content-Type"] = "application/json"
+        self._mount_adapters(pool_maxsize or int(os.environ.get('PLAYWRIGHT_POOL_MAXSIZE', '20')))
+
+        # Call coalescing (off by default): (window, max_wait) in seconds
+        self._coalesce_window: Optional[Tuple[float, float]] = None
+        self._pending: List[Tuple[Future, str, Dict[str, Any]]] = []
+        self._pending_lock = threading.Lock()
+        self._first_queued = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Serialized /evaluate bodies of constant scripts: (context, script) -> bytes
+        self._payload_cache: Dict[Tuple[str, str], bytes] = {}
+
+    def _mount_adapters(self, pool_maxsize: int):
+        """
+        Mount the retrying and retry-free adapters on the session
+
+        Adapters previously mounted on the same prefixes are closed, so
+        resizing the pool does not leak their connections.
+
+        Args:
+            pool_maxsize: Connections kept per host (one per concurrent request)
+        """
+        self._pool_maxsize = pool_maxsize
+        no_retry_prefixes = [f"{self.service_url}{endpoint}" for endpoint in _NON_IDEMPOTENT_ENDPOINTS]
+        replaced = {
+            self._session.adapters[prefix]
+            for prefix in ("http://", "https://", *no_retry_prefixes)
+            if prefix in self._session.adapters
+        }
+
+        adapter = _KeepAliveAdapter(
+            pool_connections=10, pool_maxsize=pool_maxsize, max_retries=_RETRY
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        no_retry_adapter = _KeepAliveAdapter(
+            pool_connections=10, pool_maxsize=pool_maxsize, max_retries=0
+        )
+        for prefix in no_retry_prefixes:
+            self._session.mount(prefix, no_retry_adapter)
+
+        for old_adapter in replaced:
+            old_adapter.close()
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the Playwright service and check its status
 
-    def health_check(self) -> Dict[str, Any]:
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path, starting with "/" (e.g. "/navigate")
+            **kwargs: Extra arguments for Session.request (data, params, stream, ...)
+
+        Returns:
+            Successful response
+        """
+        url = f"{self.service_url}{endpoint}"
+
+        try:
+            response = self._session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            self._health_cache = None
+            raise PlaywrightConnectionError(
+                f"Cannot connect to Playwright service at {self.service_url}: {e}"
+            ) from e
+        except requests.exceptions.Timeout as e:
+            self._health_cache = None
+            raise PlaywrightConnectionError(f"Request to {url} timed out: {e}") from e
+        except requests.exceptions.RequestException as e:
+            raise PlaywrightError(f"Request to {url} failed: {e}") from e
+
+        # Success is a plain status branch; the body is only parsed (once)
+        # here when the service reports an error
+        if response.status_code >= 400:
+            try:
+                body = _loads(response.content)
+            except ValueError:
+                body = None
+            message = body.get('error', response.text) if isinstance(body, dict) else response.text
+            raise PlaywrightError(f"Playwright API error {response.status_code}: {message}")
+
+        return response
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request to the Playwright service
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (e.g. "/navigate")
+            json_data: JSON request body
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+        """
+        body = _dumps(json_data) if json_data is not None else None
+        content = self._send(method, endpoint, data=body, params=params).content
+        # Empty 2xx bodies (e.g. 204 No Content) carry no result
+        if not content:
+            return {}
+        return _loads(content)
+
+    def _request_stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        out_path: str
+    ) -> Dict[str, Any]:
+        """
+        Request a binary artifact and stream it to a local file
+
+        The body is copied to disk in 64 KB chunks instead of being held
+        in memory.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (e.g. "/screenshot")
+            json_data: JSON request body
+            out_path: Local file to write
+
+        Returns:
+            Result with the service-side path and the local path
+        """
+        response = self._send(
+            method,
+            endpoint,
+            data=_dumps(json_data) if json_data is not None else None,
+            headers={"Accept": "application/octet-stream"},
+            stream=True
+        )
+        with response:
+            response.raw.decode_content = True
+            with open(out_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+
+        return {
+            "status": "success",
+            "path": response.headers.get("X-Artifact-Path"),
+            "local_path": out_path
+        }
+
+    def health_check(self, force: bool = False) -> Dict[str, Any]:
         """
         Check service health
 
+        Results are reused for health_ttl seconds; the cache is dropped
+        whenever a request fails to reach the service.
+
+        Args:
+            force: Always query the service
+
         Returns:
             Health status dictionary
         """
-        response = requests.get(f"{self.service_url}/health")
-        response.raise_for_status()
-        return response.json()
+        if (
+            not force
+            and self._health_cache
+            and time.monotonic() - self._health_cache[0] < self.health_ttl
+        ):
+            return self._health_cache[1]
+
+        health = self._request('GET', '/health')
+        self._health_cache = (time.monotonic(), health)
+        return health
 
     def new_context(self, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -61,15 +350,47 @@ class RemotePlaywright:
         Returns:
             Context ID
         """
-        response = requests.post(
-            f"{self.service_url}/browser/new",
-            json={"options": options or {}}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._request('POST', '/browser/new', {"options": options or {}})
         self.context_id = data["contextId"]
         return self.context_id
 
+    def acquire_context(self, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Get a browser context from the service's idle pool
+
+        An idle context created with the same options is reused; a new one
+        is only created when none is available.
+
+        Args:
+            options: Browser context options (viewport, userAgent, etc.)
+
+        Returns:
+            Context ID
+        """
+        data = self._request('POST', '/browser/acquire', {"options": options or {}})
+        self.context_id = data["contextId"]
+        return self.context_id
+
+    @_requires_context
+    def release_context(self) -> Dict[str, Any]:
+        """
+        Return the active browser context to the service's idle pool
+
+        The service clears cookies and blanks the page before handing the
+        context out again, or closes it if the pool is already full.
+
+        Returns:
+            Release result
+        """
+        result = self._request('POST', f"/browser/{self.context_id}/release", {
+            "poolSize": self.context_pool_size
+        })
+
+        self._payload_cache.clear()
+        self.context_id = None
+        return result
+
+    @_requires_context
     def navigate(self, url: str, wait_until: str = "networkidle") -> Dict[str, Any]:
         """
         Navigate to URL
@@ -81,52 +402,116 @@ class RemotePlaywright:
         Returns:
             Navigation result
         """
-        if not self.context_id:
-            raise ValueError("No active context. Call new_context() first.")
+        return self._request('POST', '/navigate', {
+            "contextId": self.context_id,
+            "url": url,
+            "waitUntil": wait_until
+        })
+
+    @_requires_context
+    def set_viewport_size(self, width: int, height: int) -> Dict[str, Any]:
+        """
+        Resize the page viewport without reloading
 
-        response = requests.post(
-            f"{self.service_url}/navigate",
-            json={
-                "contextId": self.context_id,
-                "url": url,
-                "waitUntil": wait_until
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        Args:
+            width: Viewport width in pixels
+            height: Viewport height in pixels
+
+        Returns:
+            Viewport result
+        """
+        return self._request('POST', '/viewport', {
+            "contextId": self.context_id,
+            "width": width,
+            "height": height
+        })
 
+    @_requires_context
     def screenshot(
         self,
         path: str,
         full_page: bool = False,
-        type: str = "png"
+        type: str = "png",
+        download_to: Optional[str] = None,
+        quality: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Take screenshot
 
+        The image is saved in the service's /artifacts/screenshots/. With
+        download_to, the bytes are also streamed to that local file.
+
         Args:
             path: Filename for screenshot
             full_page: Capture full scrollable page
             type: Image type (png, jpeg)
+            download_to: Local file path to stream the image to
+            quality: JPEG quality 0-100 (ignored for png)
 
         Returns:
             Screenshot result
         """
-        if not self.context_id:
-            raise ValueError("No active context. Call new_context() first.")
-
-        response = requests.post(
-            f"{self.service_url}/screenshot",
-            json={
-                "contextId": self.context_id,
-                "path": path,
-                "fullPage": full_page,
-                "type": type
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        payload = {
+            "contextId": self.context_id,
+            "path": path,
+            "fullPage": full_page,
+            "type": type
+        }
+        if quality is not None:
+            payload["quality"] = quality
+        if download_to:
+            return self._request_stream('POST', '/screenshot', payload, download_to)
+        return self._request('POST', '/screenshot', payload)
+
+    def screenshot_batch(
+        self,
+        url: str,
+        viewports: List[Dict[str, Any]],
+        full_page: bool = True,
+        type: str = "png",
+        wait_until: str = "networkidle",
+        quality: Optional[int] = None,
+        parallel: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Navigate once and take a screenshot at each viewport size
+
+        All viewports are captured in a single request, reusing the
+        current browser context. With parallel, the service instead loads
+        the URL in one pooled context per viewport at the same time; no
+        active context is needed then.
+
+        Args:
+            url: URL to capture
+            viewports: List of {"width", "height", "name"} dictionaries
+            full_page: Capture full scrollable page
+            type: Image type (png, jpeg)
+            wait_until: When to consider navigation complete
+            quality: JPEG quality 0-100 (ignored for png)
+            parallel: Capture all viewports concurrently in separate contexts
 
+        Returns:
+            Batch result with a "screenshots" list (name, width, height, path, filename)
+        """
+        if not parallel:
+            if self.context_id is None:
+                raise PlaywrightContextError(_NO_CTX_MSG)
+            self.flush()
+
+        payload = {
+            "contextId": self.context_id,
+            "url": url,
+            "viewports": viewports,
+            "fullPage": full_page,
+            "type": type,
+            "waitUntil": wait_until,
+            "parallel": parallel
+        }
+        if quality is not None:
+            payload["quality"] = quality
+        return self._request('POST', '/screenshot/batch', payload)
+
+    @_requires_context
     def evaluate(self, script: str) -> Dict[str, Any]:
         """
         Execute JavaScript in page context
@@ -137,38 +522,338 @@ class RemotePlaywright:
         Returns:
             Evaluation result
         """
-        if not self.context_id:
-            raise ValueError("No active context. Call new_context() first.")
+        return self._request('POST', '/evaluate', {
+            "contextId": self.context_id,
+            "script": script
+        })
 
-        response = requests.post(
-            f"{self.service_url}/evaluate",
-            json={
-                "contextId": self.context_id,
-                "script": script
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+    @_requires_context
+    def evaluate_cached(self, script: str) -> Dict[str, Any]:
+        """
+        Execute a constant JavaScript snippet in page context
+
+        The request body is serialized once per context and script, and
+        reused on later calls. Use evaluate() for generated scripts.
+
+        Args:
+            script: JavaScript code to execute
+
+        Returns:
+            Evaluation result
+        """
+        key = (self.context_id, script)
+        body = self._payload_cache.get(key)
+        if body is None:
+            body = self._payload_cache[key] = _dumps({"contextId": self.context_id, "script": script})
+
+        return _loads(self._send('POST', '/evaluate', data=body).content)
+
+    @_requires_context
+    def pdf(
+        self,
+        path: str = "page.pdf",
+        format: str = "A4",
+        landscape: bool = False,
+        download_to: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate PDF of the current page
+
+        The PDF is saved in the service's /artifacts/pdfs/. With download_to,
+        the bytes are also streamed to that local file.
+
+        Args:
+            path: Filename for PDF
+            format: Paper format (A4, Letter, etc.)
+            landscape: Landscape orientation
+            download_to: Local file path to stream the PDF to
+
+        Returns:
+            PDF result
+        """
+        payload = {
+            "contextId": self.context_id,
+            "path": path,
+            "format": format,
+            "landscape": landscape
+        }
+        if download_to:
+            return self._request_stream('POST', '/pdf', payload, download_to)
+        return self._request('POST', '/pdf', payload)
+
+    def batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several dependent operations in a single request
+
+        Each call is {"call_id", "method", "payload", "input_from"}, where
+        method is one of browser/new, browser/close, browser/acquire,
+        browser/release, navigate, viewport, screenshot, evaluate, and
+        input_from is the index of an earlier call whose contextId is
+        passed on. Calls depending on a failed call are skipped.
+
+        Args:
+            calls: Ordered list of calls
+
+        Returns:
+            Per-call results: {"call_id", "status", "result" | "error"} with
+            status OK, ERROR or INVALID_ARGUMENT
+        """
+        return self._request('POST', '/batch', {"calls": calls})["results"]
+
+    def enable_coalescing(self, window_ms: int = 200, max_wait_ms: int = 1000):
+        """
+        Group queued calls into /batch requests
+
+        Calls made with queue_evaluate() are flushed as one batch once no
+        new call has been queued for window_ms, or max_wait_ms after the
+        first queued call, whichever comes first. A direct call on the
+        context (navigate(), release_context(), close(), ...) flushes them
+        first, so calls still reach the service in the order they were made.
 
+        Args:
+            window_ms: Quiet period before flushing
+            max_wait_ms: Maximum delay of the oldest queued call
+        """
+        self._coalesce_window = (window_ms / 1000, max_wait_ms / 1000)
+
+    def disable_coalescing(self):
+        """Stop grouping calls and flush anything still queued"""
+        self._coalesce_window = None
+        self.flush()
+
+    def queue_evaluate(self, script: str) -> Future:
+        """
+        Execute JavaScript in page context, coalesced with other queued calls
+
+        Without enable_coalescing(), the call is sent immediately.
+
+        Args:
+            script: JavaScript code to execute
+
+        Returns:
+            Future resolving to the evaluation result
+        """
+        if self.context_id is None:
+            raise PlaywrightContextError(_NO_CTX_MSG)
+        return self._queue('evaluate', {"contextId": self.context_id, "script": script})
+
+    def _queue(self, method: str, payload: Dict[str, Any]) -> Future:
+        """
+        Queue a batch call and (re)arm the flush timer
+
+        Args:
+            method: Batch method (e.g. "evaluate")
+            payload: Call payload
+
+        Returns:
+            Future resolving to the call result
+        """
+        future = Future()
+
+        with self._pending_lock:
+            self._pending.append((future, method, payload))
+            if self._coalesce_window is not None:
+                now = time.monotonic()
+                if len(self._pending) == 1:
+                    self._first_queued = now
+
+                window, max_wait = self._coalesce_window
+                delay = min(window, self._first_queued + max_wait - now)
+
+                if self._flush_timer:
+                    self._flush_timer.cancel()
+                self._flush_timer = threading.Timer(max(delay, 0.0), self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                return future
+
+        self.flush()
+        return future
+
+    def flush(self):
+        """Send all queued calls as one /batch request and resolve their futures"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if not pending:
+            return
+
+        try:
+            results = self.batch([
+                {"call_id": str(i), "method": method, "payload": payload}
+                for i, (_, method, payload) in enumerate(pending)
+            ])
+        except PlaywrightError as e:
+            for future, _, _ in pending:
+                future.set_exception(e)
+            return
+
+        for (future, method, _), result in zip(pending, results):
+            if result["status"] == "OK":
+                future.set_result(result["result"])
+            else:
+                future.set_exception(
+                    PlaywrightError(f"Queued {method} call failed: {result.get('error')}")
+                )
+
+    def map_screenshots(
+        self,
+        urls: List[str],
+        out_dir: str,
+        max_workers: int = 8,
+        full_page: bool = True
+    ) -> List[str]:
+        """
+        Screenshot many URLs concurrently
+
+        Each URL runs acquire -> navigate -> screenshot -> release in its own
+        pooled browser context on a worker thread. All workers share this
+        client's session; the active context (self.context_id) is not used.
+
+        Args:
+            urls: URLs to capture
+            out_dir: Local directory to stream the screenshots to
+            max_workers: Maximum concurrent URLs
+            full_page: Capture full scrollable page
+
+        Returns:
+            Local screenshot paths, in the same order as urls
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        # One keep-alive connection per worker
+        if max_workers > self._pool_maxsize:
+            self._mount_adapters(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._capture_url, i, url, out_dir, full_page)
+                for i, url in enumerate(urls)
+            ]
+            return [future.result() for future in futures]
+
+    def _capture_url(self, index: int, url: str, out_dir: str, full_page: bool) -> str:
+        """
+        Screenshot one URL in its own pooled context
+
+        Thread-safe: the context ID is kept local instead of in self.context_id.
+
+        Args:
+            index: Position of the URL, used as filename prefix
+            url: URL to capture
+            out_dir: Local directory to stream the screenshot to
+            full_page: Capture full scrollable page
+
+        Returns:
+            Local screenshot path
+        """
+        host = re.sub(r'[^A-Za-z0-9.-]+', '_', urlsplit(url).netloc) or 'page'
+        filename = f"{index:03d}-{host}.png"
+        local_path = os.path.join(out_dir, filename)
+
+        context_id = self._request('POST', '/browser/acquire', {"options": {}})["contextId"]
+        try:
+            self._request('POST', '/navigate', {"contextId": context_id, "url": url})
+            self._request_stream('POST', '/screenshot', {
+                "contextId": context_id,
+                "path": filename,
+                "fullPage": full_page
+            }, local_path)
+        finally:
+            # A failed release must not mask a navigate/screenshot error
+            try:
+                self._request('POST', f"/browser/{context_id}/release", {
+                    "poolSize": self.context_pool_size
+                })
+            except PlaywrightError as e:
+                print(f"Warning: Error releasing browser context: {e}")
+
+        return local_path
+
+    @_requires_context
     def close(self) -> Dict[str, Any]:
         """
         Close browser context
 
+        Use release_context() instead to keep the context for reuse.
+
         Returns:
             Close result
         """
-        if not self.context_id:
-            raise ValueError("No active context to close.")
-
-        response = requests.post(
-            f"{self.service_url}/browser/{self.context_id}/close"
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = self._request('POST', f"/browser/{self.context_id}/close")
 
+        self._payload_cache.clear()
         self.context_id = None
         return result
 
+    close_context = close
+
+    def close_session(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self._session.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: release any active context, then close the session"""
+        try:
+            self.flush()
+            if self.context_id:
+                self.release_context()
+        except PlaywrightError as e:
+            print(f"Warning: Error releasing browser context: {e}")
+        finally:
+            self.close_session()
+
+    def __del__(self):
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+
+
+def quick_screenshot(
+    url: str,
+    path: str = "screenshot.png",
+    full_page: bool = True,
+    service_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Take a screenshot of a URL in a single round trip
+
+    Acquires a pooled context, navigates, takes the screenshot and releases
+    the context as one batch request.
+
+    Args:
+        url: URL to capture
+        path: Filename for screenshot
+        full_page: Capture full scrollable page
+        service_url: URL of Playwright service (default: from env)
+
+    Returns:
+        Screenshot result
+    """
+    with RemotePlaywright(service_url=service_url) as pw:
+        results = pw.batch([
+            {"call_id": "acquire", "method": "browser/acquire", "payload": {}},
+            {"call_id": "navigate", "method": "navigate",
+             "payload": {"url": url}, "input_from": 0},
+            {"call_id": "screenshot", "method": "screenshot",
+             "payload": {"path": path, "fullPage": full_page}, "input_from": 1},
+            {"call_id": "release", "method": "browser/release",
+             "payload": {"poolSize": pw.context_pool_size}, "input_from": 0},
+        ])
+
+    for call in results[:3]:
+        if call["status"] != "OK":
+            raise PlaywrightError(f"quick_screenshot failed at {call['call_id']}: {call.get('error')}")
+
+    return results[2]["result"]
+
 
 if __name__ == "__main__":
     # Example usage
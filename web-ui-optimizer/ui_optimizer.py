@@ -18,14 +18,216 @@ Original file backed up to: ui_optimizer.py.original
 
 import os
 import json
+import logging
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Import remote Playwright client
 from remote_playwright import RemotePlaywright, PlaywrightError, PlaywrightConnectionError
 from connection import wait_for_playwright_service
 
+logger = logging.getLogger(__name__)
+
+# JPEG quality used when screenshots are not taken as lossless PNG
+JPEG_QUALITY = 80
+
+# Audit results kept per (URL, viewport, DOM fingerprint)
+AUDIT_CACHE_SIZE = 64
+
+# Most frequent colors returned by an audit unless more are requested
+DEFAULT_TOP_COLORS = 20
+
+# Items listed for the open-ended accessibility checks (headings, links);
+# beyond this only the count is reported
+DEFAULT_SAMPLE_SIZE = 20
+
+# ============================================================================
+# Page scripts (constant, so their request bodies can be reused)
+# ============================================================================
+
+# Colors (top topK) and accessibility issues (headings and empty links capped
+# at sampleSize) of the page in one DOM pass; called through _audit_script()
+_JS_AUDIT = r'''(topK, sampleSize) => {
+    const checks = {
+        images_without_alt: [],
+        missing_labels: [],
+        heading_structure: { count: 0, sample: [] },
+        links_without_text: { count: 0, sample: [] }
+    };
+
+    // Count every item, keep only the first sampleSize
+    const record = (check, item) => {
+        if (check.count++ < sampleSize) check.sample.push(item);
+    };
+
+    // Colors are counted under a packed integer key r,g,b,a (one byte
+    // each); other color syntaxes (e.g. color(srgb ...)) by their string
+    const histogram = new Map();
+    const otherColors = new Map();
+    const RGBA = /^rgba?\((\d+), (\d+), (\d+)(?:, ([\d.]+))?\)$/;
+
+    const addColor = (value) => {
+        const m = RGBA.exec(value);
+        if (m === null) {
+            if (value) otherColors.set(value, (otherColors.get(value) || 0) + 1);
+            return;
+        }
+
+        const alpha = m[4] === undefined ? 255 : Math.round(m[4] * 255);
+        if (alpha === 0) return;  // fully transparent
+
+        const key = m[1] * 16777216 + m[2] * 65536 + m[3] * 256 + alpha;
+        histogram.set(key, (histogram.get(key) || 0) + 1);
+    };
+
+    const unpack = (key) => {
+        const r = Math.floor(key / 16777216);
+        const g = Math.floor(key / 65536) % 256;
+        const b = Math.floor(key / 256) % 256;
+        const a = key % 256;
+        return a === 255
+            ? `rgb(${r}, ${g}, ${b})`
+            : `rgba(${r}, ${g}, ${b}, ${Math.round(a / 255 * 100) / 100})`;
+    };
+
+    // label[for] ids, collected once instead of a DOM query per input
+    const labelFor = new Set();
+    const labels = document.getElementsByTagName('label');
+    for (let i = 0; i < labels.length; i++) {
+        if (labels[i].htmlFor) labelFor.add(labels[i].htmlFor);
+    }
+
+    const nonVisual = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'META', 'LINK', 'TEMPLATE']);
+
+    // getComputedStyle is the expensive part: only call it for
+    // rendered elements that can carry a visible color
+    const countColors = (el) => {
+        if (nonVisual.has(el.tagName)) return;
+        if (el.offsetParent === null && el !== document.body &&
+            el.getClientRects().length === 0) return;
+
+        const style = window.getComputedStyle(el);
+        addColor(style.getPropertyValue('color'));
+        addColor(style.getPropertyValue('background-color'));
+    };
+
+    countColors(document.body);
+
+    const els = document.body.getElementsByTagName('*');
+    for (let i = 0; i < els.length; i++) {
+        const el = els[i];
+
+        countColors(el);
+
+        // Accessibility
+        switch (el.tagName) {
+            case 'IMG':
+                if (!el.alt) {
+                    checks.images_without_alt.push(el.src || 'inline-image');
+                }
+                break;
+
+            case 'INPUT':
+            case 'SELECT':
+            case 'TEXTAREA': {
+                const id = el.id;
+                const ariaLabel = el.getAttribute('aria-label');
+                if (id && !labelFor.has(id) && !ariaLabel) {
+                    checks.missing_labels.push({
+                        type: el.type,
+                        name: el.name || 'unnamed',
+                        id: id
+                    });
+                }
+                break;
+            }
+
+            case 'H1': case 'H2': case 'H3':
+            case 'H4': case 'H5': case 'H6':
+                record(checks.heading_structure, {
+                    level: el.tagName,
+                    text: el.textContent.substring(0, 50)
+                });
+                break;
+
+            case 'A':
+                if (!el.textContent.trim() && el.getElementsByTagName('img').length === 0) {
+                    record(checks.links_without_text, el.href);
+                }
+                break;
+        }
+    }
+
+    return {
+        // Sorted on the packed keys; only the top colors are decoded and sent
+        colors: [...histogram.entries(), ...otherColors.entries()]
+            .sort((a, b) => b[1] - a[1])
+            .slice(0, topK)
+            .map(([key, count]) => ({
+                color: typeof key === 'number' ? unpack(key) : key,
+                count
+            })),
+        accessibility: checks
+    };
+}'''
+
+# URL, viewport (computed colors and visibility depend on it) plus length
+# and FNV-1a hash of the serialized DOM; a linear string scan, far cheaper
+# than the computed-style walk of _JS_AUDIT
+_JS_FINGERPRINT = '''() => {
+    const html = document.documentElement.outerHTML;
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < html.length; i++) {
+        hash ^= html.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return [location.href, innerWidth, innerHeight, devicePixelRatio,
+            html.length, hash >>> 0];
+}'''
+
+# DOM text, including hidden elements and inline scripts/styles (no layout)
+_JS_TEXT = "() => document.body.textContent"
+
+# Rendered text only (innerText needs an up-to-date layout)
+_JS_VISIBLE_TEXT = "() => document.body.innerText"
+
+# Navigation and paint timings of the current page load
+_JS_PERFORMANCE = '''() => {
+    const perfData = performance.getEntriesByType('navigation')[0];
+    const paintEntries = performance.getEntriesByType('paint');
+
+    return {
+        domContentLoaded: perfData.domContentLoadedEventEnd - perfData.domContentLoadedEventStart,
+        loadComplete: perfData.loadEventEnd - perfData.loadEventStart,
+        domInteractive: perfData.domInteractive,
+        responseTime: perfData.responseEnd - perfData.requestStart,
+        firstPaint: paintEntries.find(e => e.name === 'first-paint')?.startTime,
+        firstContentfulPaint: paintEntries.find(e => e.name === 'first-contentful-paint')?.startTime
+    };
+}'''
+
+# Adds a <style> element; formatted with the JSON-encoded CSS text
+_JS_INJECT_CSS = '''() => {
+    const style = document.createElement('style');
+    style.textContent = %s;
+    document.head.appendChild(style);
+}'''
+
+# Resolves once web fonts are loaded and two frames have been rendered,
+# i.e. injected styles have been applied and painted
+_JS_SETTLE = '''() => document.fonts.ready.then(
+    () => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))
+)'''
+
+
+@functools.lru_cache(maxsize=None)
+def _audit_script(top_k: int, sample_size: int) -> str:
+    """Build the audit page script for the given limits (one string per pair)"""
+    return f"() => ({_JS_AUDIT})({int(top_k)}, {int(sample_size)})"
+
 
 class UIOptimizer:
     """
@@ -45,209 +247,217 @@ class UIOptimizer:
         self.service_url = service_url
         self.pw = None
         self.context_id = None
+        self._audit_cache: "OrderedDict[Tuple, Tuple[Tuple[int, int], Dict]]" = OrderedDict()
+        self._created_dirs = set()
 
     def initialize(self):
         """Initialize connection to Playwright service"""
-        print("Connecting to Playwright service...")
+        logger.info("Connecting to Playwright service...")
         self.pw = RemotePlaywright(service_url=self.service_url)
 
         # Verify service is accessible
         try:
             health = self.pw.health_check()
-            print(f"✅ Connected to Playwright service")
-            print(f"   Browser: {health.get('browser', {}).get('version', 'Unknown')}")
+            logger.info("✅ Connected to Playwright service")
+            logger.info("   Browser: %s", health.get('browser', {}).get('version', 'Unknown'))
         except PlaywrightConnectionError as e:
-            print(f"❌ Cannot connect to Playwright service: {e}")
+            logger.error("❌ Cannot connect to Playwright service: %s", e)
             raise
 
         # Create browser context
         self.context_id = self.pw.new_context()
-        print(f"✅ Browser context created: {self.context_id}")
+        logger.info("✅ Browser context created: %s", self.context_id)
+
+    def _ensure_dir(self, path: str):
+        """Create an output directory once per UIOptimizer instance"""
+        if path not in self._created_dirs:
+            Path(path).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
 
     def capture_responsive(
         self,
         url: str,
-        output_dir: str = './screenshots'
+        output_dir: str = './screenshots',
+        renavigate: bool = False,
+        image_format: str = 'jpeg',
+        parallel: bool = False,
+        wait_until: str = 'load'
     ) -> List[Dict]:
         """
         Capture screenshots at different viewport sizes
 
+        The page is loaded once in a single browser context and resized
+        between screenshots.
+
         Args:
             url: URL to capture
             output_dir: Directory to save screenshots
+            renavigate: Reload the page at each size (for sites whose
+                layout depends on the viewport at load time)
+            image_format: 'jpeg' (smaller) or 'png' (lossless)
+            parallel: Load the page in one browser context per viewport
+                concurrently (each size gets its own load, like renavigate)
+            wait_until: Load state to wait for before capturing; web fonts
+                are always awaited. 'networkidle' can hang on sites with
+                polling or analytics traffic.
 
         Returns:
             List of dictionaries with screenshot information
         """
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         viewports = [
-            {'width': 375, 'height': 667, 'device': 'iPhone-SE'},
-            {'width': 768, 'height': 1024, 'device': 'iPad'},
-            {'width': 1366, 'height': 768, 'device': 'laptop'},
-            {'width': 1920, 'height': 1080, 'device': 'desktop'}
+            {'width': 375, 'height': 667, 'name': 'iPhone-SE'},
+            {'width': 768, 'height': 1024, 'name': 'iPad'},
+            {'width': 1366, 'height': 768, 'name': 'laptop'},
+            {'width': 1920, 'height': 1080, 'name': 'desktop'}
         ]
 
-        screenshots = []
-
-        for viewport in viewports:
-            # Create new context with specific viewport
-            # Note: In current implementation, we recreate context for each viewport
-            # A future optimization could support viewport changes within same context
+        # The parallel capture runs in the service's own pooled contexts
+        if not parallel and not self.context_id:
+            self.context_id = self.pw.new_context()
+
+        quality = JPEG_QUALITY if image_format == 'jpeg' else None
+
+        if parallel:
+            # One request: the service overlaps the page loads of all sizes
+            shots = self.pw.screenshot_batch(
+                url, viewports, full_page=True, type=image_format, quality=quality,
+                wait_until=wait_until, parallel=True
+            ).get('screenshots', [])
+        elif renavigate:
+            shots = []
+            for viewport in viewports:
+                width, height = viewport['width'], viewport['height']
+                filename = f"{viewport['name']}-{width}x{height}.{image_format}"
+
+                self.pw.set_viewport_size(width, height)
+                self.pw.navigate(url, wait_until=wait_until)
+                self.pw.evaluate_cached(_JS_SETTLE)
+                result = self.pw.screenshot(
+                    filename, full_page=True, type=image_format, quality=quality
+                )
+
+                shots.append({**viewport, 'path': result['path'], 'filename': filename})
+        else:
+            # One request: the service navigates once in the current context
+            # and resizes the viewport between screenshots
+            shots = self.pw.screenshot_batch(
+                url, viewports, full_page=True, type=image_format, quality=quality,
+                wait_until=wait_until
+            ).get('screenshots', [])
 
-            if self.context_id:
-                self.pw.close()
-
-            self.context_id = self.pw.new_context(options={
-                "viewport": {
-                    "width": viewport['width'],
-                    "height": viewport['height']
-                }
-            })
-
-            # Navigate to URL
-            self.pw.navigate(url, wait_until="networkidle")
-
-            # Take screenshot
-            filename = f"{viewport['device']}-{viewport['width']}x{viewport['height']}.png"
-            filepath = os.path.join(output_dir, filename)
-
-            self.pw.screenshot(filename, full_page=True)
+        screenshots = []
 
+        for shot in shots:
             screenshots.append({
-                'device': viewport['device'],
-                'dimensions': f"{viewport['width']}x{viewport['height']}",
-                'path': f"/artifacts/screenshots/{filename}",
-                'local_path': filepath
+                'device': shot['name'],
+                'dimensions': f"{shot['width']}x{shot['height']}",
+                'path': shot['path'],
+                'local_path': os.path.join(output_dir, shot['filename'])
             })
 
-            print(f"✅ Captured {viewport['device']} view")
+            logger.info("✅ Captured %s view", shot['name'])
 
         return screenshots
 
-    def analyze_colors(self) -> List[Dict[str, any]]:
+    def audit(
+        self,
+        refresh: bool = False,
+        top_k: int = DEFAULT_TOP_COLORS,
+        sample_size: int = DEFAULT_SAMPLE_SIZE
+    ) -> Dict:
         """
-        Extract and analyze color palette from the current page
+        Analyze colors and accessibility of the current page in one DOM pass
+
+        Only the most frequent colors are sent back by the browser (at least
+        DEFAULT_TOP_COLORS), so the response does not grow with the number
+        of distinct colors on the page.
+
+        Results are cached (LRU, AUDIT_CACHE_SIZE entries) by URL, viewport
+        and a fingerprint of the DOM, so analyze_colors() and
+        check_accessibility() - and re-audits of an unchanged page, even
+        after reloading it - reuse the same result.
+
+        Args:
+            refresh: Re-run the analysis even if the page looks unchanged
+            top_k: Number of colors needed
+            sample_size: Headings / empty links listed (all are counted)
 
         Returns:
-            List of dictionaries with color information
+            Dictionary with 'colors' and 'accessibility'
         """
-        script = '''() => {
-            const elements = document.querySelectorAll('*');
-            const colorMap = new Map();
-
-            elements.forEach(el => {
-                const style = window.getComputedStyle(el);
-                const color = style.color;
-                const bgColor = style.backgroundColor;
+        key = tuple(self.pw.evaluate_cached(_JS_FINGERPRINT).get('result', ()))
+        limits = (max(top_k, DEFAULT_TOP_COLORS), max(sample_size, DEFAULT_SAMPLE_SIZE))
 
-                if (color && color !== 'rgba(0, 0, 0, 0)') {
-                    colorMap.set(color, (colorMap.get(color) || 0) + 1);
-                }
-                if (bgColor && bgColor !== 'rgba(0, 0, 0, 0)') {
-                    colorMap.set(bgColor, (colorMap.get(bgColor) || 0) + 1);
-                }
-            });
+        cached = self._audit_cache.get(key)
+        if not refresh and cached and all(have >= need for have, need in zip(cached[0], limits)):
+            self._audit_cache.move_to_end(key)
+            return cached[1]
 
-            return Array.from(colorMap.entries())
-                .sort((a, b) => b[1] - a[1])
-                .map(([color, count]) => ({ color, count }));
-        }'''
+        result = self.pw.evaluate_cached(_audit_script(*limits)).get('result', {})
 
-        result = self.pw.evaluate(script)
-        return result.get('result', [])
+        self._audit_cache[key] = (limits, result)
+        if len(self._audit_cache) > AUDIT_CACHE_SIZE:
+            self._audit_cache.popitem(last=False)
+        return result
 
-    def check_accessibility(self) -> Dict:
+    def analyze_colors(self, top_k: int = DEFAULT_TOP_COLORS) -> List[Dict[str, any]]:
         """
-        Perform basic accessibility checks
+        Extract and analyze color palette from the current page
+
+        Args:
+            top_k: Number of most frequent colors to return
 
         Returns:
-            Dictionary with accessibility issues
+            List of dictionaries with color information, most used first
         """
-        script = '''() => {
-            const checks = {
-                images_without_alt: [],
-                missing_labels: [],
-                heading_structure: [],
-                links_without_text: []
-            };
-
-            // Check images
-            document.querySelectorAll('img').forEach(img => {
-                if (!img.alt) {
-                    checks.images_without_alt.push(img.src || 'inline-image');
-                }
-            });
+        return self.audit(top_k=top_k).get('colors', [])[:top_k]
 
-            // Check form inputs
-            document.querySelectorAll('input, select, textarea').forEach(input => {
-                const id = input.id;
-                const ariaLabel = input.getAttribute('aria-label');
-                if (id && !document.querySelector(`label[for="${id}"]`) && !ariaLabel) {
-                    checks.missing_labels.push({
-                        type: input.type,
-                        name: input.name || 'unnamed',
-                        id: id
-                    });
-                }
-            });
-
-            // Check headings
-            const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
-            checks.heading_structure = Array.from(headings).map(h => ({
-                level: h.tagName,
-                text: h.textContent.substring(0, 50)
-            }));
-
-            // Check links
-            document.querySelectorAll('a').forEach(link => {
-                if (!link.textContent.trim() && !link.querySelector('img')) {
-                    checks.links_without_text.push(link.href);
-                }
-            });
+    def check_accessibility(self, sample_size: int = DEFAULT_SAMPLE_SIZE) -> Dict:
+        """
+        Perform basic accessibility checks
 
-            return checks;
-        }'''
+        heading_structure and links_without_text can be very long on large
+        pages, so they are reported as {'count', 'sample'} with at most
+        sample_size items in the sample.
 
-        result = self.pw.evaluate(script)
-        return result.get('result', {})
+        Args:
+            sample_size: Headings / empty links to list
+
+        Returns:
+            Dictionary with accessibility issues
+        """
+        checks = dict(self.audit(sample_size=sample_size).get('accessibility', {}))
+        for name in ('heading_structure', 'links_without_text'):
+            if name in checks:
+                checks[name] = {**checks[name], 'sample': checks[name]['sample'][:sample_size]}
+        return checks
 
-    def measure_performance(self, url: str) -> Dict:
+    def measure_performance(self, url: Optional[str] = None) -> Dict:
         """
         Measure page load performance metrics
 
         Args:
-            url: URL to measure
+            url: URL to load and measure (default: the page already loaded)
 
         Returns:
             Dictionary with performance metrics
         """
-        # Navigate to URL
-        self.pw.navigate(url)
-
-        # Get performance metrics
-        script = '''() => {
-            const perfData = performance.getEntriesByType('navigation')[0];
-            const paintEntries = performance.getEntriesByType('paint');
-
-            return {
-                domContentLoaded: perfData.domContentLoadedEventEnd - perfData.domContentLoadedEventStart,
-                loadComplete: perfData.loadEventEnd - perfData.loadEventStart,
-                domInteractive: perfData.domInteractive,
-                responseTime: perfData.responseEnd - perfData.requestStart,
-                firstPaint: paintEntries.find(e => e.name === 'first-paint')?.startTime,
-                firstContentfulPaint: paintEntries.find(e => e.name === 'first-contentful-paint')?.startTime
-            };
-        }'''
-
-        result = self.pw.evaluate(script)
+        if url:
+            self.pw.navigate(url)
+
+        # Get performance metrics of the current page load
+        result = self.pw.evaluate_cached(_JS_PERFORMANCE)
         return result.get('result', {})
 
     def compare_before_after(
         self,
         url: str,
         css_changes: str,
-        output_dir: str = './comparisons'
+        output_dir: str = './comparisons',
+        image_format: str = 'jpeg',
+        wait_until: str = 'load'
     ) -> Dict[str, str]:
         """
         Capture before/after screenshots with CSS changes
@@ -256,38 +466,39 @@ class UIOptimizer:
             url: URL to test
             css_changes: CSS code to inject
             output_dir: Directory to save comparisons
+            image_format: 'jpeg' (smaller) or 'png' (lossless)
+            wait_until: Load state to wait for before capturing
 
         Returns:
             Dictionary with paths to before/after screenshots
         """
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         # Navigate to page
-        self.pw.navigate(url, wait_until="networkidle")
+        self.pw.navigate(url, wait_until=wait_until)
+        self.pw.evaluate_cached(_JS_SETTLE)
+
+        quality = JPEG_QUALITY if image_format == 'jpeg' else None
 
         # Capture before
-        before_filename = 'before.png'
-        self.pw.screenshot(before_filename, full_page=True)
-        before_path = f"/artifacts/screenshots/{before_filename}"
+        before_filename = f'before.{image_format}'
+        before_path = self.pw.screenshot(
+            before_filename, full_page=True, type=image_format, quality=quality
+        )['path']
 
         # Apply CSS changes
-        script = f'''() => {{
-            const style = document.createElement('style');
-            style.textContent = `{css_changes}`;
-            document.head.appendChild(style);
-        }}'''
-        self.pw.evaluate(script)
+        self.pw.evaluate(_JS_INJECT_CSS % json.dumps(css_changes))
 
-        # Wait for styles to apply (simulate wait_for_timeout)
-        import time
-        time.sleep(0.5)
+        # Wait until the new styles are rendered
+        self.pw.evaluate_cached(_JS_SETTLE)
 
         # Capture after
-        after_filename = 'after.png'
-        self.pw.screenshot(after_filename, full_page=True)
-        after_path = f"/artifacts/screenshots/{after_filename}"
+        after_filename = f'after.{image_format}'
+        after_path = self.pw.screenshot(
+            after_filename, full_page=True, type=image_format, quality=quality
+        )['path']
 
-        print('✅ Before/After comparison saved')
+        logger.info("✅ Before/After comparison saved")
 
         return {
             'before': before_path,
@@ -296,24 +507,34 @@ class UIOptimizer:
             'local_after': os.path.join(output_dir, after_filename)
         }
 
-    def extract_text(self) -> str:
+    def extract_text(self, visible_only: bool = False) -> str:
         """
         Extract all text content from the current page
 
+        By default this is the DOM text (textContent): no layout is needed,
+        but text of hidden elements and inline scripts/styles is included
+        and whitespace is not normalized.
+
+        Args:
+            visible_only: Return the rendered text (innerText) instead,
+                which forces a layout pass
+
         Returns:
             Text content of page
         """
-        script = '() => document.body.innerText'
-        result = self.pw.evaluate(script)
-        return result.get('result', '')
+        script = _JS_VISIBLE_TEXT if visible_only else _JS_TEXT
+        return self.pw.evaluate_cached(script).get('result', '')
 
     def cleanup(self):
-        """Clean up resources"""
-        if self.pw and self.context_id:
+        """Clean up resources: close the browser context and the HTTP session"""
+        if self.pw:
             try:
-                self.pw.close()
+                if self.pw.context_id:
+                    self.pw.close()
             except Exception as e:
-                print(f"Warning: Error during cleanup: {e}")
+                logger.warning("Error during cleanup: %s", e)
+            finally:
+                self.pw.close_session()
 
     def __enter__(self):
         """Context manager entry"""
@@ -331,6 +552,9 @@ if __name__ == "__main__":
 
     url = sys.argv[1] if len(sys.argv) > 1 else "https://example.com"
 
+    # Show UIOptimizer progress messages alongside the CLI output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print(f"🔍 Analyzing {url}...")
     print()
 
@@ -349,33 +573,36 @@ if __name__ == "__main__":
 
     try:
         with UIOptimizer() as optimizer:
-            # Navigate to page
-            optimizer.pw.navigate(url)
+            # Navigate once; every analysis below reads this page load
+            optimizer.pw.navigate(url, wait_until="load")
 
-            # Capture screenshots
+            # Capture screenshots (separate pooled contexts, loaded concurrently)
             print("📸 Capturing responsive screenshots...")
-            screenshots = optimizer.capture_responsive(url)
+            screenshots = optimizer.capture_responsive(url, parallel=True)
             print(f"✅ Captured {len(screenshots)} responsive screenshots")
 
+            # Colors and accessibility come from a single audit pass
+            audit = optimizer.audit()
+
             # Analyze colors
             print("\n🎨 Analyzing colors...")
-            colors = optimizer.analyze_colors()
+            colors = audit.get('colors', [])
             print("Top 5 colors:")
             for item in colors[:5]:
                 print(f"  - {item['color']}: used {item['count']} times")
 
             # Check accessibility
             print("\n♿ Checking accessibility...")
-            accessibility = optimizer.check_accessibility()
+            accessibility = audit.get('accessibility', {})
             print(f"Accessibility check:")
             print(f"  - Images without alt: {len(accessibility.get('images_without_alt', []))}")
             print(f"  - Inputs without labels: {len(accessibility.get('missing_labels', []))}")
-            print(f"  - Headings found: {len(accessibility.get('heading_structure', []))}")
-            print(f"  - Links without text: {len(accessibility.get('links_without_text', []))}")
+            print(f"  - Headings found: {accessibility.get('heading_structure', {}).get('count', 0)}")
+            print(f"  - Links without text: {accessibility.get('links_without_text', {}).get('count', 0)}")
 
             # Measure performance
             print("\n⚡ Measuring performance...")
-            performance = optimizer.measure_performance(url)
+            performance = optimizer.measure_performance()
             print(f"Performance metrics:")
             print(f"  - DOM Content Loaded: {performance.get('domContentLoaded', 'N/A')}ms")
             print(f"  - Page Load Complete: {performance.get('loadComplete', 'N/A')}ms")